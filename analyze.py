@@ -6,9 +6,10 @@ on detecting echo/repetition problems across agents.
 """
 
 import argparse
-import re
+import heapq
 import string
 from collections import Counter, defaultdict
+from typing import NamedTuple
 
 import duckdb
 from rich.console import Console
@@ -16,6 +17,15 @@ from rich.table import Table
 
 DEFAULT_DB = "data/dive_bar.duckdb"
 
+# Total order for message columns
+MSG_ORDER = "created_at, turn_number, message_id"
+
+# Rows shown in each ranked report table
+REPORT_ROWS = 20
+
+# Rows pulled per fetchmany() call
+FETCH_BATCH = 2048
+
 STOP_WORDS = frozenset({
     "i", "me", "my", "we", "you", "your", "he", "she",
     "it", "they", "them", "the", "a", "an", "and", "or",
@@ -30,205 +40,305 @@ STOP_WORDS = frozenset({
     "dont", "im", "ive", "thats", "yeah", "oh",
 })
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# Opener and duplicate detection run inside DuckDB
+# so only rows that survive the HAVING filter are
+# materialized in Python.
+OPENERS_SQL = rf"""
+WITH ordered AS (
+    SELECT agent_name,
+        row_number() OVER (
+            ORDER BY {MSG_ORDER}
+        ) AS rn,
+        list_slice(regexp_split_to_array(
+            content_lc, '\s+'
+        ), 1, 6) AS words
+    FROM msgs
+), openers AS (
+    SELECT agent_name, rn,
+        trim(regexp_replace(
+            array_to_string(words, ' '),
+            '[^\p{{L}}\p{{N}}_\s]', '', 'g'
+        )) AS opener
+    FROM ordered
+    WHERE len(words) >= 3
+)
+SELECT agent_name AS agent, opener,
+    COUNT(*) AS "count"
+FROM openers
+GROUP BY agent_name, opener
+HAVING COUNT(*) >= 3
+ORDER BY agent, "count" DESC, min(rn)
+"""
+
+DUPES_SQL = rf"""
+WITH normed AS (
+    SELECT agent_name,
+        row_number() OVER (
+            ORDER BY {MSG_ORDER}
+        ) AS rn,
+        regexp_replace(
+            content_lc, '\s+', ' ', 'g'
+        ) AS norm
+    FROM msgs
+)
+SELECT left(norm, 80) AS text, COUNT(*) AS "count",
+    list_sort(list(DISTINCT agent_name)) AS agents
+FROM normed
+GROUP BY norm
+HAVING COUNT(*) >= 2
+ORDER BY "count" DESC, min(rn)
+"""
+
+
+class MessageColumns(NamedTuple):
+    """Messages under analysis, one list per column."""
+
+    contents: list[str]
+    agents: list[str]
+    turns: list[int]
+
 
 def open_db(path: str) -> duckdb.DuckDBPyConnection:
     """Open a read-only DuckDB connection."""
     return duckdb.connect(path, read_only=True)
 
 
-def fetch_messages(
+def _session_filter(
+    session_id: str | None,
+) -> tuple[str, list]:
+    """Build a WHERE clause for a session ID prefix."""
+    if session_id:
+        return "WHERE session_id LIKE ? || '%'", [
+            session_id
+        ]
+    return "", []
+
+
+def _fetch_dicts(
     con: duckdb.DuckDBPyConnection,
-    session_id: str | None = None,
+    query: str,
+    params: list | None = None,
 ) -> list[dict]:
-    """Query messages, optionally filtered by session."""
-    query = (
-        "SELECT message_id, session_id, "
-        "turn_number, agent_name, content, "
-        "created_at, tokens_prompt, "
-        "tokens_completion, generation_time_ms "
-        "FROM messages"
+    """Run a query and return rows as dicts.
+
+    Rows are pulled in FETCH_BATCH chunks, so the full
+    tuple list and the dict list never coexist.
+    """
+    cur = con.execute(query, params or [])
+    cols = [d[0] for d in cur.description]
+    fetch = cur.fetchmany
+    rows: list[dict] = []
+    while batch := fetch(FETCH_BATCH):
+        rows.extend(dict(zip(cols, r)) for r in batch)
+    return rows
+
+
+def scope_messages(
+    con: duckdb.DuckDBPyConnection,
+    session_id: str | None = None,
+) -> None:
+    """Materialize the messages under analysis as `msgs`.
+
+    Rows are copied once into a temp table along with
+    content_lc, the trimmed lowercase text, so each
+    report reuses it instead of re-normalizing.
+    """
+    where, params = _session_filter(session_id)
+    con.execute(
+        "CREATE TEMP TABLE msgs AS "
+        "SELECT *, lower(regexp_replace("
+        r"content, '^\s+|\s+$', '', 'g'"
+        f")) AS content_lc FROM messages {where}",
+        params,
     )
-    params = []
-    if session_id:
-        query += (
-            " WHERE session_id LIKE ? || '%'"
-        )
-        params.append(session_id)
-    query += " ORDER BY created_at, turn_number"
-    rows = con.execute(query, params).fetchall()
-    cols = [
-        "message_id", "session_id", "turn_number",
-        "agent_name", "content", "created_at",
-        "tokens_prompt", "tokens_completion",
-        "generation_time_ms",
-    ]
-    return [dict(zip(cols, r)) for r in rows]
+
+
+def fetch_messages(
+    con: duckdb.DuckDBPyConnection,
+) -> MessageColumns:
+    """Query the scoped messages in conversation order.
+
+    DuckDB builds each column as one list aggregate,
+    so no per-row tuples are materialized. message_id
+    breaks ordering ties so the columns line up.
+    """
+    row = con.execute(
+        "SELECT "
+        f"list(content ORDER BY {MSG_ORDER}), "
+        f"list(agent_name ORDER BY {MSG_ORDER}), "
+        f"list(turn_number ORDER BY {MSG_ORDER}) "
+        "FROM msgs"
+    ).fetchone()
+    return MessageColumns(*(col or [] for col in row))
 
 
 def fetch_sessions(
     con: duckdb.DuckDBPyConnection,
 ) -> list[dict]:
     """Query all sessions."""
-    rows = con.execute(
+    return _fetch_dicts(
+        con,
         "SELECT session_id, started_at, ended_at, "
         "bar_name, agent_count, config_hash "
-        "FROM sessions ORDER BY started_at"
-    ).fetchall()
-    cols = [
-        "session_id", "started_at", "ended_at",
-        "bar_name", "agent_count", "config_hash",
-    ]
-    return [dict(zip(cols, r)) for r in rows]
+        "FROM sessions ORDER BY started_at",
+    )
 
 
 def tokenize(text: str) -> list[str]:
     """Lowercase, strip punctuation, remove stops."""
-    text = text.lower()
-    text = text.translate(
-        str.maketrans("", "", string.punctuation)
-    )
-    words = text.split()
+    words = text.lower().translate(_PUNCT_TABLE).split()
     return [w for w in words if w not in STOP_WORDS]
 
 
 def extract_ngrams(
-    words: list[str], n: int
+    words: list[str],
+    n_min: int = 3,
+    n_max: int = 6,
 ) -> list[tuple[str, ...]]:
-    """Return contiguous n-grams from word list."""
-    if len(words) < n:
-        return []
+    """Return contiguous n-grams for every n in range.
+
+    Builds all sizes in one comprehension, ordered by
+    size then position.
+    """
+    size = len(words)
     return [
         tuple(words[i:i + n])
-        for i in range(len(words) - n + 1)
+        for n in range(n_min, n_max + 1)
+        for i in range(size - n + 1)
     ]
 
 
 def dedup_ngrams(
-    phrases: dict[tuple[str, ...], set[str]],
-) -> dict[tuple[str, ...], set[str]]:
-    """Remove ngrams that are subsets of longer ones."""
-    sorted_keys = sorted(
-        phrases.keys(), key=len, reverse=True
-    )
-    kept: dict[tuple[str, ...], set[str]] = {}
-    for gram in sorted_keys:
-        gram_str = " ".join(gram)
-        is_sub = any(
-            gram_str in " ".join(k)
-            for k in kept
-            if len(k) > len(gram)
+    phrases: dict[tuple[str, ...], int],
+) -> dict[tuple[str, ...], int]:
+    """Remove ngrams that are subsets of longer ones.
+
+    Each kept gram registers its contiguous sub-grams
+    (at most 21 for a 6-gram) in a set, so checking a
+    candidate is one lookup and the pass is linear.
+    """
+    covered: set[tuple[str, ...]] = set()
+    kept: dict[tuple[str, ...], int] = {}
+    for gram in sorted(phrases, key=len, reverse=True):
+        if gram in covered:
+            continue
+        kept[gram] = phrases[gram]
+        size = len(gram)
+        covered.update(
+            gram[i:j]
+            for i in range(size)
+            for j in range(i + 1, size + 1)
         )
-        if not is_sub:
-            kept[gram] = phrases[gram]
     return kept
 
 
+def _tally_ngrams(
+    agents: list[str],
+    tokens: list[list[str]],
+) -> tuple[Counter, dict[tuple[str, ...], int], list[str]]:
+    """Count 3-6 grams and record which agents used them.
+
+    Agents per gram are an int bitmask (bit i is the
+    i-th agent in the returned name list) rather than
+    a set of names.
+    """
+    agent_bits: dict[str, int] = {}
+    agent_masks: dict[
+        tuple[str, ...], int
+    ] = defaultdict(int)
+    ngram_counts: Counter = Counter()
+    count_grams = ngram_counts.update
+    for agent, words in zip(agents, tokens):
+        grams = extract_ngrams(words)
+        count_grams(grams)
+        bit = agent_bits.setdefault(
+            agent, 1 << len(agent_bits)
+        )
+        for gram in grams:
+            agent_masks[gram] |= bit
+    return ngram_counts, agent_masks, list(agent_bits)
+
+
 def detect_echoes(
-    messages: list[dict],
+    agents: list[str],
+    tokens: list[list[str]],
+    limit: int | None = None,
 ) -> dict[str, list]:
     """Cross-agent ngram analysis for echoes.
 
     Finds 3-6 word phrases used by 2+ different
-    agents 3+ times total.
+    agents 3+ times total. agents and tokens hold
+    each message's speaker and tokenize() output.
+    With limit, only the most frequent are returned.
     """
-    agent_ngrams: dict[
-        tuple[str, ...], set[str]
-    ] = defaultdict(set)
-    ngram_counts: Counter = Counter()
-    for msg in messages:
-        words = tokenize(msg["content"])
-        agent = msg["agent_name"]
-        for n in range(3, 7):
-            for gram in extract_ngrams(words, n):
-                agent_ngrams[gram].add(agent)
-                ngram_counts[gram] += 1
+    ngram_counts, agent_masks, names = _tally_ngrams(
+        agents, tokens
+    )
+    # mask & (mask - 1) is nonzero when 2+ bits are set
     shared = {
-        gram: agents
-        for gram, agents in agent_ngrams.items()
-        if len(agents) >= 2 and ngram_counts[gram] >= 3
+        gram: mask
+        for gram, mask in agent_masks.items()
+        if mask & (mask - 1) and ngram_counts[gram] >= 3
     }
     shared = dedup_ngrams(shared)
     results = []
-    for gram, agents in sorted(
+    for gram, mask in heapq.nlargest(
+        len(shared) if limit is None else limit,
         shared.items(),
         key=lambda x: ngram_counts[x[0]],
-        reverse=True,
     ):
         results.append({
             "phrase": " ".join(gram),
             "count": ngram_counts[gram],
-            "agents": sorted(agents),
+            "agents": sorted(
+                name for i, name in enumerate(names)
+                if mask >> i & 1
+            ),
         })
     return {"cross_agent_phrases": results}
 
 
+def _limited(query: str, limit: int | None) -> str:
+    """Append a LIMIT clause when limit is set."""
+    if limit is None:
+        return query
+    return f"{query} LIMIT {int(limit)}"
+
+
 def find_opener_patterns(
-    messages: list[dict],
+    con: duckdb.DuckDBPyConnection,
+    limit: int | None = None,
 ) -> list[dict]:
-    """Find repeated message openers per agent."""
-    agent_openers: dict[
-        str, Counter
-    ] = defaultdict(Counter)
-    for msg in messages:
-        words = msg["content"].lower().split()[:6]
-        if len(words) >= 3:
-            opener = " ".join(words)
-            opener = re.sub(
-                r"[^\w\s]", "", opener
-            ).strip()
-            agent_openers[msg["agent_name"]][
-                opener
-            ] += 1
-    results = []
-    for agent, openers in sorted(
-        agent_openers.items()
-    ):
-        for opener, count in openers.most_common():
-            if count >= 3:
-                results.append({
-                    "agent": agent,
-                    "opener": opener,
-                    "count": count,
-                })
-    return results
+    """Find repeated message openers per agent.
+
+    Normalization and counting run inside DuckDB;
+    only openers used 3+ times come back. With limit,
+    DuckDB keeps a top-N heap instead of a full sort.
+    """
+    return _fetch_dicts(
+        con, _limited(OPENERS_SQL, limit)
+    )
 
 
 def find_exact_dupes(
-    messages: list[dict],
+    con: duckdb.DuckDBPyConnection,
+    limit: int | None = None,
 ) -> list[dict]:
-    """Find exact duplicate messages."""
-    seen: dict[str, list[dict]] = defaultdict(list)
-    for msg in messages:
-        normalized = re.sub(
-            r"\s+", " ", msg["content"].strip().lower()
-        )
-        seen[normalized].append({
-            "agent": msg["agent_name"],
-            "turn": msg["turn_number"],
-        })
-    results = []
-    for text, entries in seen.items():
-        if len(entries) >= 2:
-            agents = {e["agent"] for e in entries}
-            results.append({
-                "text": text[:80],
-                "count": len(entries),
-                "agents": sorted(agents),
-            })
-    results.sort(key=lambda x: x["count"], reverse=True)
-    return results
+    """Find exact duplicate messages.
+
+    Whitespace/case normalization and grouping run
+    inside DuckDB; only duplicated texts come back.
+    With limit, only the most repeated are returned.
+    """
+    return _fetch_dicts(con, _limited(DUPES_SQL, limit))
 
 
 def compute_agent_stats(
     con: duckdb.DuckDBPyConnection,
-    session_id: str | None = None,
 ) -> list[dict]:
     """Compute per-agent aggregate statistics."""
-    where = ""
-    params = []
-    if session_id:
-        where = "WHERE session_id LIKE ? || '%'"
-        params.append(session_id)
     query = (
         "SELECT agent_name, "
         "COUNT(*) AS msg_count, "
@@ -238,81 +348,111 @@ def compute_agent_stats(
         "  AS avg_gen_ms, "
         "ROUND(AVG(LENGTH(content)), 0) "
         "  AS avg_chars "
-        f"FROM messages {where} "
+        "FROM msgs "
         "GROUP BY agent_name "
         "ORDER BY msg_count DESC"
     )
-    rows = con.execute(query, params).fetchall()
-    cols = [
-        "agent_name", "msg_count", "avg_tokens",
-        "avg_gen_ms", "avg_chars",
-    ]
-    return [dict(zip(cols, r)) for r in rows]
+    return _fetch_dicts(con, query)
+
+
+def count_words(tokens: list[list[str]]) -> Counter:
+    """Tally words across pre-tokenized messages."""
+    counts: Counter = Counter()
+    for words in tokens:
+        counts.update(words)
+    return counts
 
 
 def detect_topics(
-    messages: list[dict],
+    turns: list[int],
+    tokens: list[list[str]],
+    word_counts: Counter,
 ) -> dict[str, object]:
     """Word frequency analysis and stale stretches."""
-    all_words: Counter = Counter()
-    for msg in messages:
-        words = tokenize(msg["content"])
-        all_words.update(words)
-    stale = _find_stale_stretches(messages)
+    stale = _find_stale_stretches(turns, tokens)
     return {
-        "top_words": all_words.most_common(20),
+        "top_words": word_counts.most_common(20),
         "stale_stretches": stale,
     }
 
 
+def _window_counts(
+    per_msg: list[Counter], start: int, size: int
+) -> Counter:
+    """Sum per-message word counts over a window."""
+    counts: Counter = Counter()
+    for c in per_msg[start:start + size]:
+        counts.update(c)
+    return counts
+
+
 def _find_stale_stretches(
-    messages: list[dict],
+    turns: list[int],
+    tokens: list[list[str]],
 ) -> list[dict]:
     """Find stretches where one word dominates 5+ turns.
 
     Returns stretches with start turn, end turn, and
-    the dominating word.
+    the dominating word. The window counter slides
+    by adding the entering message and subtracting
+    the leaving one instead of being rebuilt.
     """
-    if len(messages) < 5:
-        return []
     window = 5
+    last = len(turns) - window
+    if last < 0:
+        return []
+    per_msg = [Counter(words) for words in tokens]
+    current = _window_counts(per_msg, 0, window)
     stretches = []
     i = 0
-    while i <= len(messages) - window:
-        chunk = messages[i:i + window]
-        words_combined: Counter = Counter()
-        for msg in chunk:
-            words_combined.update(
-                tokenize(msg["content"])
-            )
-        if not words_combined:
-            i += 1
-            continue
-        top_word, top_count = (
-            words_combined.most_common(1)[0]
-        )
-        if top_count >= window:
-            stretches.append({
-                "start_turn": chunk[0]["turn_number"],
-                "end_turn": chunk[-1]["turn_number"],
-                "word": top_word,
-                "count": top_count,
-            })
+    while i <= last:
+        top = max(current.values(), default=0)
+        if top >= window:
+            stretches.append(_stretch(
+                turns, tokens, i, window,
+                current, top,
+            ))
             i += window
-        else:
-            i += 1
+            current = _window_counts(per_msg, i, window)
+            continue
+        if i < last:
+            current -= per_msg[i]
+            current += per_msg[i + window]
+        i += 1
     return stretches
 
 
+def _stretch(
+    turns: list[int],
+    tokens: list[list[str]],
+    start: int,
+    window: int,
+    counts: Counter,
+    top: int,
+) -> dict:
+    """Describe one stale stretch.
+
+    Ties go to the word seen first in the window,
+    matching Counter.most_common on a fresh count.
+    """
+    word = next(
+        w for words in tokens[start:start + window]
+        for w in words if counts[w] == top
+    )
+    return {
+        "start_turn": turns[start],
+        "end_turn": turns[start + window - 1],
+        "word": word,
+        "count": top,
+    }
+
+
 def compute_topic_diversity(
-    messages: list[dict],
+    word_counts: Counter,
 ) -> dict[str, float]:
     """Compute unique-word / total-word ratio."""
-    all_words = []
-    for msg in messages:
-        all_words.extend(tokenize(msg["content"]))
-    total = len(all_words)
-    unique = len(set(all_words))
+    total = sum(word_counts.values())
+    unique = len(word_counts)
     ratio = unique / total if total > 0 else 0.0
     return {
         "total_words": total,
@@ -338,60 +478,59 @@ def compute_session_summary(
         "  s.ended_at, s.bar_name, s.agent_count "
         "ORDER BY s.started_at"
     )
-    rows = con.execute(query).fetchall()
-    cols = [
-        "session_id", "started_at", "ended_at",
-        "bar_name", "agent_count", "msg_count",
-        "active_agents",
-    ]
-    return [dict(zip(cols, r)) for r in rows]
+    return _fetch_dicts(con, query)
 
 
 def fetch_regenerations(
     con: duckdb.DuckDBPyConnection,
     session_id: str | None = None,
+    limit: int | None = None,
 ) -> list[dict]:
-    """Query regeneration events."""
+    """Query regeneration events, oldest first.
+
+    With limit set, only the most recent events are
+    fetched.
+    """
+    where, params = _session_filter(session_id)
     query = (
         "SELECT regen_id, session_id, turn_number, "
         "agent_name, attempt_count, created_at "
-        "FROM regenerations"
+        f"FROM regenerations {where} "
+        "ORDER BY created_at DESC"
     )
-    params = []
-    if session_id:
-        query += " WHERE session_id LIKE ? || '%'"
-        params.append(session_id)
-    query += " ORDER BY created_at"
     try:
-        rows = con.execute(query, params).fetchall()
+        rows = _fetch_dicts(
+            con, _limited(query, limit), params
+        )
     except duckdb.CatalogException:
         return []
-    cols = [
-        "regen_id", "session_id", "turn_number",
-        "agent_name", "attempt_count", "created_at",
-    ]
-    return [dict(zip(cols, r)) for r in rows]
+    rows.reverse()
+    return rows
 
 
 def compute_regen_stats(
-    regens: list[dict],
+    con: duckdb.DuckDBPyConnection,
+    session_id: str | None = None,
 ) -> dict[str, object]:
-    """Compute regeneration statistics."""
-    if not regens:
-        return {
-            "total_regens": 0,
-            "by_agent": {},
-            "avg_attempts": 0.0,
-        }
-    by_agent: dict[str, int] = defaultdict(int)
-    total_attempts = 0
-    for r in regens:
-        by_agent[r["agent_name"]] += 1
-        total_attempts += r["attempt_count"]
-    avg = total_attempts / len(regens) if regens else 0.0
+    """Compute regeneration statistics in DuckDB."""
+    where, params = _session_filter(session_id)
+    query = (
+        "SELECT agent_name, COUNT(*) AS n, "
+        "SUM(attempt_count) AS attempts "
+        f"FROM regenerations {where} "
+        "GROUP BY agent_name "
+        "ORDER BY n DESC, agent_name"
+    )
+    try:
+        rows = con.execute(query, params).fetchall()
+    except duckdb.CatalogException:
+        rows = []
+    total = sum(n for _, n, _ in rows)
+    attempts = sum(a for _, _, a in rows)
+    avg = attempts / total if total else 0.0
     return {
-        "total_regens": len(regens),
-        "by_agent": dict(by_agent),
+        "total_regens": total,
+        "by_agent": {name: n for name, n, _ in rows},
         "avg_attempts": round(avg, 2),
     }
 
@@ -407,7 +546,7 @@ def render_echoes(
         table.add_column("Phrase", style="yellow")
         table.add_column("Count", justify="right")
         table.add_column("Agents")
-        for p in phrases[:20]:
+        for p in phrases[:REPORT_ROWS]:
             table.add_row(
                 p["phrase"],
                 str(p["count"]),
@@ -427,7 +566,7 @@ def _render_openers(
         table.add_column("Agent", style="cyan")
         table.add_column("Opener", style="yellow")
         table.add_column("Count", justify="right")
-        for o in openers[:20]:
+        for o in openers[:REPORT_ROWS]:
             table.add_row(
                 o["agent"],
                 o["opener"],
@@ -447,7 +586,7 @@ def _render_dupes(
         table.add_column("Text", style="yellow")
         table.add_column("Count", justify="right")
         table.add_column("Agents")
-        for d in dupes[:20]:
+        for d in dupes[:REPORT_ROWS]:
             table.add_row(
                 d["text"],
                 str(d["count"]),
@@ -628,6 +767,21 @@ def main() -> None:
         con.close()
 
 
+def _report_echoes(
+    console: Console,
+    con: duckdb.DuckDBPyConnection,
+    agents: list[str],
+    tokens: list[list[str]],
+) -> None:
+    """Run and render the echo/repetition reports."""
+    echoes = detect_echoes(agents, tokens, REPORT_ROWS)
+    openers = find_opener_patterns(con, REPORT_ROWS)
+    dupes = find_exact_dupes(con, REPORT_ROWS)
+    render_echoes(console, echoes)
+    _render_openers(console, openers)
+    _render_dupes(console, dupes)
+
+
 def _dispatch(
     console: Console,
     con: duckdb.DuckDBPyConnection,
@@ -636,28 +790,31 @@ def _dispatch(
     """Route subcommand to the right handler."""
     cmd = args.command
     sid = getattr(args, "session", None)
+    msgs = MessageColumns([], [], [])
+    tokens: list[list[str]] = []
+    if cmd in ("echoes", "agents", "topics", "all"):
+        scope_messages(con, sid)
+    if cmd in ("echoes", "topics", "all"):
+        msgs = fetch_messages(con)
+        tokens = [tokenize(c) for c in msgs.contents]
     if cmd in ("echoes", "all"):
-        msgs = fetch_messages(con, sid)
-        echoes = detect_echoes(msgs)
-        openers = find_opener_patterns(msgs)
-        dupes = find_exact_dupes(msgs)
-        render_echoes(console, echoes)
-        _render_openers(console, openers)
-        _render_dupes(console, dupes)
+        _report_echoes(console, con, msgs.agents, tokens)
     if cmd in ("agents", "all"):
-        stats = compute_agent_stats(con, sid)
+        stats = compute_agent_stats(con)
         render_agents(console, stats)
     if cmd in ("topics", "all"):
-        msgs = fetch_messages(con, sid)
-        topic_data = detect_topics(msgs)
-        diversity = compute_topic_diversity(msgs)
+        counts = count_words(tokens)
+        topic_data = detect_topics(
+            msgs.turns, tokens, counts
+        )
+        diversity = compute_topic_diversity(counts)
         render_topics(console, topic_data, diversity)
     if cmd in ("sessions", "all"):
         summaries = compute_session_summary(con)
         render_sessions(console, summaries)
     if cmd in ("regens", "all"):
-        regens = fetch_regenerations(con, sid)
-        stats = compute_regen_stats(regens)
+        stats = compute_regen_stats(con, sid)
+        regens = fetch_regenerations(con, sid, limit=10)
         render_regens(console, stats, regens)
 
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Agent class for Dive Bar."""
 
+from collections.abc import Sequence
+
 from dive_bar.models import AgentConfig, Message
 
 SYSTEM_TEMPLATE = """You are {name}. You are at a dive bar \
@@ -57,6 +59,17 @@ TOPIC_CHANGE_TEMPLATE = (
     "sentences, first person, no name prefix."
 )
 
+# Formatted once per agent with name; {last} is
+# filled in each turn.
+REPLY_SUFFIX_TEMPLATE = (
+    "\n\nNow reply as {name}, in first "
+    "person. React directly to {last}"
+    " -- agree, disagree, ask them "
+    "something, or roast them. 1-2 "
+    "sentences. No name prefix, "
+    "no narration."
+)
+
 CHARS_PER_TOKEN = 4
 MAX_SCRIPT_LINES = 10
 
@@ -64,6 +77,18 @@ MAX_SCRIPT_LINES = 10
 class Agent:
     """An AI agent with a personality at the bar."""
 
+    __slots__ = (
+        "config",
+        "bar_name",
+        "max_context",
+        "max_tokens",
+        "system_prompt",
+        "_sys_tokens",
+        "system_msg",
+        "_reply_head",
+        "_reply_tail",
+    )
+
     def __init__(
         self,
         config: AgentConfig,
@@ -76,6 +101,18 @@ class Agent:
         self.max_context = max_context
         self.max_tokens = max_tokens
         self.system_prompt = self._build_system()
+        self._sys_tokens = self._estimate_tokens(
+            self.system_prompt
+        )
+        self.system_msg = {
+            "role": "system",
+            "content": self.system_prompt,
+        }
+        # Split around {last} so neither name is ever
+        # parsed as a format string.
+        head, tail = REPLY_SUFFIX_TEMPLATE.split("{last}")
+        self._reply_head = head.format(name=config.name)
+        self._reply_tail = tail
 
     def _build_system(self) -> str:
         """Construct the system prompt."""
@@ -95,7 +132,7 @@ class Agent:
 
     def build_topic_prompt(
         self,
-        recent_topics: list[str] | None = None,
+        recent_topics: Sequence[str] | None = None,
     ) -> list[dict]:
         """Build messages to generate a random topic.
 
@@ -122,7 +159,7 @@ class Agent:
 
     def build_messages(
         self,
-        history: list[Message],
+        history: Sequence[Message],
         new_topic: str | None = None,
     ) -> list[dict]:
         """Build chat messages for the LLM.
@@ -132,16 +169,9 @@ class Agent:
         When new_topic is set, instructs the agent
         to change the subject.
         """
-        system_msg = {
-            "role": "system",
-            "content": self.system_prompt,
-        }
-        sys_tokens = self._estimate_tokens(
-            self.system_prompt
-        )
         budget = (
             self.max_context
-            - sys_tokens
+            - self._sys_tokens
             - self.max_tokens
             - 100  # safety margin
         )
@@ -161,23 +191,18 @@ class Agent:
             )
         else:
             content = (
-                f"{script}\n\n"
-                f"Now reply as {name}, in first "
-                f"person. React directly to {last}"
-                f" -- agree, disagree, ask them "
-                f"something, or roast them. 1-2 "
-                f"sentences. No name prefix, "
-                f"no narration."
+                script + self._reply_head
+                + last + self._reply_tail
             )
         user_msg = {
             "role": "user",
             "content": content,
         }
-        return [system_msg, user_msg]
+        return [self.system_msg, user_msg]
 
     def _build_script(
         self,
-        history: list[Message],
+        history: Sequence[Message],
         budget: int,
     ) -> str:
         """Build a script of recent conversation.
@@ -185,12 +210,14 @@ class Agent:
         Caps at MAX_SCRIPT_LINES to prevent echo
         templates from accumulating in the context.
         """
-        recent = history[-MAX_SCRIPT_LINES:]
+        # Snapshot first: the UI thread may append to
+        # a live history deque while this runs.
+        recent = list(history)[-MAX_SCRIPT_LINES:]
         lines = []
         used = 0
         for msg in reversed(recent):
             line = f"{msg.agent_name}: {msg.content}"
-            tokens = self._estimate_tokens(line)
+            tokens = len(line) // CHARS_PER_TOKEN + 1
             if used + tokens > budget:
                 break
             lines.append(line)
@@ -2,7 +2,6 @@
 """Anthropic API inference engine for Dive Bar."""
 
 import os
-import threading
 import time
 
 import anthropic
@@ -17,8 +16,8 @@ class APIEngine:
     def __init__(self, config: LLMConfig):
         self.config = config
         self.gen_params = config.generation
-        self._lock = threading.Lock()
         self._client = None
+        self._base_kwargs: dict = {}
 
     def load_model(self):
         """Initialize the Anthropic client."""
@@ -36,6 +35,16 @@ class APIEngine:
         if api_cfg.base_url:
             kwargs["base_url"] = api_cfg.base_url
         self._client = anthropic.Anthropic(**kwargs)
+        self._base_kwargs = self._build_base_kwargs()
+
+    def _build_base_kwargs(self) -> dict:
+        """Request kwargs fixed for the session."""
+        return {
+            "model": self.config.api.model,
+            "max_tokens": self.gen_params.max_tokens,
+            "temperature": self.gen_params.temperature,
+            "top_k": self.gen_params.top_k,
+        }
 
     def generate(
         self,
@@ -45,42 +54,26 @@ class APIEngine:
     ) -> GenerationResult:
         """Generate a response via Anthropic API.
 
-        Thread-safe: acquires lock so only one agent
-        generates at a time.
+        Thread-safe without a lock: the Anthropic
+        client can be shared across worker threads.
         """
         if self._client is None:
             raise RuntimeError("API client not loaded")
-        params = self._merge_params(overrides)
-        with self._lock:
-            return self._do_generate(
-                messages, params, stop
-            )
-
-    def _merge_params(
-        self, overrides: dict
-    ) -> dict:
-        """Merge generation defaults with overrides."""
-        return {
-            "temperature": self.gen_params.temperature,
-            "top_p": self.gen_params.top_p,
-            "top_k": self.gen_params.top_k,
-            "max_tokens": self.gen_params.max_tokens,
-            **overrides,
-        }
+        return self._do_generate(
+            messages, stop, overrides
+        )
 
     def _build_api_kwargs(
         self,
-        params: dict,
         chat_msgs: list[dict],
         system_text: str,
-        stop: list[str] | None = None,
+        stop: list[str] | None,
+        overrides: dict,
     ) -> dict:
         """Build kwargs dict for Anthropic API call."""
         kwargs = {
-            "model": self.config.api.model,
-            "max_tokens": params["max_tokens"],
-            "temperature": params["temperature"],
-            "top_k": params["top_k"],
+            **self._base_kwargs,
+            **overrides,
             "messages": chat_msgs,
         }
         if system_text:
@@ -97,20 +90,20 @@ class APIEngine:
     def _do_generate(
         self,
         messages: list[dict],
-        params: dict,
-        stop: list[str] | None = None,
+        stop: list[str] | None,
+        overrides: dict,
     ) -> GenerationResult:
-        """Run inference via API (must hold lock)."""
+        """Run inference via API."""
         system_text, chat_msgs = self._split_system(
             messages
         )
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         kwargs = self._build_api_kwargs(
-            params, chat_msgs, system_text, stop
+            chat_msgs, system_text, stop, overrides
         )
         result = self._client.messages.create(**kwargs)
         elapsed_ms = (
-            (time.perf_counter() - t0) * 1000
+            (time.perf_counter_ns() - t0) / 1_000_000
         )
         content = self._extract_content(result)
         return GenerationResult(
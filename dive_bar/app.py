@@ -4,6 +4,7 @@
 import random
 import re
 import time
+from collections import deque
 from pathlib import Path
 
 from textual.app import App, ComposeResult
@@ -12,11 +13,12 @@ from textual.containers import Horizontal
 from textual.widgets import Footer, Header
 from textual.worker import Worker, WorkerState
 
-from dive_bar.agent import Agent
+from dive_bar.agent import MAX_SCRIPT_LINES, Agent
 from dive_bar.bartender import Bartender
 from dive_bar.db import Database
 from dive_bar.diversity import (
     DiversityResult,
+    build_history_profile,
     compute_diversity_score,
 )
 from dive_bar.inference import InferenceEngine
@@ -32,6 +34,11 @@ from dive_bar.widgets.controls import (
     StrangerMessage,
 )
 
+# Leading "Name:" / "Name N:" speaker prefix
+_NAME_PREFIX_RE = re.compile(r'^[A-Z][\w]*(\s+\d+)?:\s*')
+# A "Name:" line starting mid-response
+_NAME_MID_RE = re.compile(r'\n\s*[A-Z][\w\s]*:')
+
 
 class DiveBarApp(App):
     """The Dive Bar TUI application."""
@@ -68,60 +75,47 @@ class DiveBarApp(App):
         self.title = (
             f"{config.bar.name} -- Dive Bar"
         )
-        self.history: list[Message] = []
+        # Prompts and diversity checks never look
+        # further back than this.
+        self.history: deque[Message] = deque(
+            maxlen=max(
+                MAX_SCRIPT_LINES,
+                config.diversity.window_size,
+            )
+        )
         self.speed_mult = 1.0
         self._session_id = ""
         self._subject_count = 0
-        self._recent_topics: list[str] = []
+        self._recent_topics: deque[str] = deque(
+            maxlen=5
+        )
         self._opener = ""
         self._setup_components()
 
     def _setup_components(self):
         """Initialize core components."""
         self.engine = self._create_engine()
-        self.engines: dict = {}
-        self.house_engine = None
-        if self.config.llm.mode == "api":
-            self._create_api_engines()
         root = Path(__file__).resolve().parent.parent
         db_path = root / self.config.database.path
         self.db = Database(str(db_path))
         self.agents = self._create_agents()
+        self._stops = self._build_stops()
         self.bartender = Bartender(
             [a.config for a in self.agents.values()],
             self.config.bar.tick_interval,
         )
 
     def _create_engine(self):
-        """Pick inference engine based on config mode."""
+        """Pick inference engine based on config mode.
+
+        One engine serves every agent; in API mode
+        that means one client and connection pool.
+        """
         if self.config.llm.mode == "api":
             from dive_bar.api_engine import APIEngine
             return APIEngine(self.config.llm)
         return InferenceEngine(self.config.llm)
 
-    def _create_api_engines(self):
-        """Create per-agent API engines + house engine."""
-        from dive_bar.api_engine import APIEngine
-        for ac in self.config.agents:
-            self.engines[ac.name] = APIEngine(
-                self.config.llm
-            )
-        self.house_engine = APIEngine(
-            self.config.llm
-        )
-
-    def _get_engine(self, name: str | None = None):
-        """Route to the correct engine by agent name.
-
-        Per-agent engine if available, else house
-        engine, else single local engine.
-        """
-        if name and name in self.engines:
-            return self.engines[name]
-        if self.house_engine:
-            return self.house_engine
-        return self.engine
-
     def _create_agents(self) -> dict[str, Agent]:
         """Create Agent instances from config."""
         agents = {}
@@ -137,6 +131,18 @@ class DiveBarApp(App):
             )
         return agents
 
+    def _build_stops(self) -> dict[str, list[str]]:
+        """Stop sequences per agent: everyone else's
+        name prefix plus the fixed speakers."""
+        fixed = ["Bartender:", "A stranger:", "\n\n"]
+        return {
+            name: [
+                f"{n}:" for n in self.agents
+                if n != name
+            ] + fixed
+            for name in self.agents
+        }
+
     def compose(self) -> ComposeResult:
         """Build the app layout."""
         yield Header()
@@ -144,8 +150,14 @@ class DiveBarApp(App):
             (a.config.name, a.config.drink)
             for a in self.agents.values()
         ]
+        chat = ChatPanel(id="chat")
+        chat.register_agents([
+            "Bartender",
+            *(name for name, _ in agent_info),
+            "A stranger",
+        ])
         with Horizontal(id="main-area"):
-            yield ChatPanel(id="chat")
+            yield chat
             yield AgentSidebar(
                 agent_info, id="sidebar"
             )
@@ -178,19 +190,10 @@ class DiveBarApp(App):
             self.engine.config.model_path = str(
                 model_path
             )
-            self.engine.load_model()
-        else:
-            self._load_api_engines()
+        self.engine.load_model()
         self._opener = self._generate_opener()
         return "ready"
 
-    def _load_api_engines(self):
-        """Load all per-agent + house API engines."""
-        for eng in self.engines.values():
-            eng.load_model()
-        if self.house_engine:
-            self.house_engine.load_model()
-
     def on_worker_state_changed(
         self, event: Worker.StateChanged
     ) -> None:
@@ -258,7 +261,7 @@ class DiveBarApp(App):
                 ).format(topic=topic),
             },
         ]
-        result = self._get_engine().generate(
+        result = self.engine.generate(
             prompt, stop=["\n"], max_tokens=30,
         )
         text = result.content.strip().strip("'\"")
@@ -313,12 +316,8 @@ class DiveBarApp(App):
         messages = self._build_turn_messages(
             agent, max_subj
         )
-        stop = [
-            f"{n}:" for n in self.agents
-            if n != name
-        ] + ["Bartender:", "A stranger:", "\n\n"]
-        engine = self._get_engine(name)
-        result = engine.generate(
+        stop = self._stops[name]
+        result = self.engine.generate(
             messages, stop=stop
         )
         content = self._clean_response(
@@ -334,19 +333,11 @@ class DiveBarApp(App):
                 self._log_regeneration(
                     name, regen_count
                 )
-        score = self.bartender.get_score(
-            name,
-            self.history[-1]
-            if self.history
-            else None,
-        )
+        last = self.history[-1] if self.history else None
+        score = self.bartender.get_score(name, last)
         # Always record spoke to prevent loops
-        last_speaker = (
-            self.history[-1].agent_name
-            if self.history else None
-        )
         self.bartender.record_spoke(
-            name, last_speaker
+            name, last.agent_name if last else None
         )
         if not content:
             self.call_from_thread(
@@ -380,9 +371,7 @@ class DiveBarApp(App):
         and tells the agent to change the subject.
         """
         if self._subject_count >= max_subj:
-            topic = self._generate_topic(
-                agent, agent.config.name
-            )
+            topic = self._generate_topic(agent)
             self._subject_count = 0
             return agent.build_messages(
                 self.history, new_topic=topic
@@ -390,14 +379,12 @@ class DiveBarApp(App):
         self._subject_count += 1
         return agent.build_messages(self.history)
 
-    def _generate_topic(
-        self, agent, name: str | None = None
-    ) -> str:
+    def _generate_topic(self, agent) -> str:
         """Ask the LLM for a random bar topic."""
         prompt = agent.build_topic_prompt(
             self._recent_topics or None
         )
-        result = self._get_engine(name).generate(
+        result = self.engine.generate(
             prompt,
             stop=["\n"],
             max_tokens=20,
@@ -405,8 +392,6 @@ class DiveBarApp(App):
         topic = result.content.strip().strip("'\"")
         if topic:
             self._recent_topics.append(topic)
-            if len(self._recent_topics) > 5:
-                self._recent_topics.pop(0)
         return topic
 
     def _diversity_loop(
@@ -421,23 +406,31 @@ class DiveBarApp(App):
 
         Returns (final_content, regen_count).
         """
+        # History is fixed for the turn; scan it once
+        profile = build_history_profile(
+            self.history,
+            name,
+            window=div_cfg.window_size,
+            ngram_min=div_cfg.ngram_min,
+            ngram_max=div_cfg.ngram_max,
+        )
         attempt = 0
         while attempt < div_cfg.max_retries:
             diversity = compute_diversity_score(
                 content,
                 self.history,
                 name,
-                window=div_cfg.window_size,
                 threshold=div_cfg.threshold,
                 ngram_min=div_cfg.ngram_min,
                 ngram_max=div_cfg.ngram_max,
+                profile=profile,
             )
             if diversity.passed:
                 break
             feedback = self._build_rephrase_prompt(
                 agent, content, diversity
             )
-            result = self._get_engine(name).generate(
+            result = self.engine.generate(
                 feedback, stop=stop
             )
             content = self._clean_response(
@@ -459,10 +452,7 @@ class DiveBarApp(App):
             f"- {p}" for p in diversity.problems[:3]
         )
         return [
-            {
-                "role": "system",
-                "content": agent.system_prompt,
-            },
+            agent.system_msg,
             {
                 "role": "user",
                 "content": (
@@ -499,15 +489,10 @@ class DiveBarApp(App):
         """Strip name prefixes and truncate at
         any dialogue pattern."""
         cleaned = text.strip()
-        # Strip leading "Name:" / "Name N:" prefix
-        cleaned = re.sub(
-            r'^[A-Z][\w]*(\s+\d+)?:\s*',
+        cleaned = _NAME_PREFIX_RE.sub(
             '', cleaned, count=1
         ).strip()
-        # Truncate at any "Name:" mid-response
-        match = re.search(
-            r'\n\s*[A-Z][\w\s]*:', cleaned
-        )
+        match = _NAME_MID_RE.search(cleaned)
         if match:
             cleaned = cleaned[
                 :match.start()
@@ -657,11 +642,5 @@ class DiveBarApp(App):
         if self._session_id:
             self.db.end_session(self._session_id)
         self.db.close()
-        if self.engines:
-            for eng in self.engines.values():
-                eng.unload()
-            if self.house_engine:
-                self.house_engine.unload()
-        else:
-            self.engine.unload()
+        self.engine.unload()
         self.exit()
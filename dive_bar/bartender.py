@@ -42,13 +42,19 @@ class Bartender:
         self.agents = {
             a.name: a for a in agent_configs
         }
+        self._lower_names = {
+            name: name.lower() for name in self.agents
+        }
         self.tick_interval = tick_interval
         self.cooldown = tick_interval * COOLDOWN_MULT
         self.last_spoke: dict[str, float] = {}
         self.last_spoke_turn: dict[str, int] = {}
         self.turn_number = 0
         self.paused = False
-        self._pair_history: list[tuple[str, str]] = []
+        # Latest speaker dyad and how many turns in a
+        # row it has held
+        self._streak_dyad: frozenset[str] | None = None
+        self._streak_len = 0
 
     def select_next(
         self,
@@ -62,47 +68,50 @@ class Bartender:
         """
         if self.paused:
             return None
-        addressed = self._find_addressed(
-            last_message
-        )
+        now = time.time()
+        mentioned = self._mentioned(last_message)
+        addressed = self._find_addressed(mentioned, now)
         if addressed and not self._pair_locked(
             last_message.agent_name, addressed
         ):
             return addressed
-        eligible = self._get_eligible()
-        if not eligible:
-            return None
-        scores = {
-            name: self._score_agent(
-                name, last_message
-            )
-            for name in eligible
-        }
-        winner = max(scores, key=scores.get)
-        return winner
+        return self._best_scored(mentioned, now)
+
+    def _mentioned(
+        self, last_message: Message | None
+    ) -> frozenset[str]:
+        """Agents named in the last message.
+
+        Lowercases the content once; the speaker is
+        never counted as mentioning themselves.
+        """
+        if last_message is None:
+            return frozenset()
+        content = last_message.content.lower()
+        speaker = last_message.agent_name
+        return frozenset(
+            name
+            for name, lower in self._lower_names.items()
+            if name != speaker and lower in content
+        )
 
     def _find_addressed(
         self,
-        last_message: Message | None,
+        mentioned: frozenset[str],
+        now: float,
     ) -> str | None:
-        """Check if last message names an agent.
+        """First mentioned agent not in cooldown.
 
         Returns the addressed agent's name if found
-        and eligible, else None. Skips the speaker.
+        and eligible, else None.
         """
-        if last_message is None:
-            return None
-        content = last_message.content.lower()
-        speaker = last_message.agent_name
-        now = time.time()
         for name in self.agents:
-            if name == speaker:
+            if name not in mentioned:
                 continue
             last = self.last_spoke.get(name, 0.0)
             if now - last < self.cooldown:
                 continue
-            if name.lower() in content:
-                return name
+            return name
         return None
 
     def _pair_locked(
@@ -114,12 +123,10 @@ class Bartender:
         involve the same two agents in either direction
         (A->B or B->A both count).
         """
-        dyad = frozenset((speaker, responder))
-        tail = self._pair_history[-MAX_PAIR_STREAK:]
-        if len(tail) < MAX_PAIR_STREAK:
-            return False
-        return all(
-            frozenset(p) == dyad for p in tail
+        return (
+            self._streak_len >= MAX_PAIR_STREAK
+            and self._streak_dyad
+            == frozenset((speaker, responder))
         )
 
     def record_spoke(
@@ -133,14 +140,12 @@ class Bartender:
         )
         self.turn_number += 1
         if last_speaker:
-            self._pair_history.append(
-                (last_speaker, agent_name)
-            )
-            # Keep bounded
-            if len(self._pair_history) > 20:
-                self._pair_history = (
-                    self._pair_history[-10:]
-                )
+            dyad = frozenset((last_speaker, agent_name))
+            if dyad == self._streak_dyad:
+                self._streak_len += 1
+            else:
+                self._streak_dyad = dyad
+                self._streak_len = 1
 
     def get_score(
         self,
@@ -149,29 +154,44 @@ class Bartender:
     ) -> float:
         """Public access to an agent's score."""
         return self._score_agent(
-            agent_name, last_message
+            agent_name,
+            self._mentioned(last_message),
+            time.time(),
         )
 
-    def _get_eligible(self) -> list[str]:
-        """Return agents not in cooldown."""
-        now = time.time()
-        eligible = []
+    def _best_scored(
+        self,
+        mentioned: frozenset[str],
+        now: float,
+    ) -> str | None:
+        """Highest-scoring agent not in cooldown.
+
+        Ties go to the earlier agent in config order.
+        """
+        best, best_score = None, 0.0
         for name in self.agents:
             last = self.last_spoke.get(name, 0.0)
-            if now - last >= self.cooldown:
-                eligible.append(name)
-        return eligible
+            if now - last < self.cooldown:
+                continue
+            score = self._score_agent(
+                name, mentioned, now
+            )
+            if best is None or score > best_score:
+                best, best_score = name, score
+        return best
 
     def _score_agent(
         self,
         name: str,
-        last_message: Message | None,
+        mentioned: frozenset[str],
+        now: float,
     ) -> float:
         """Compute selection score for one agent."""
         agent = self.agents[name]
-        t_factor = self._time_factor(name)
-        a_factor = self._addressed_factor(
-            name, agent, last_message
+        t_factor = self._time_factor(name, now)
+        a_factor = (
+            agent.responsiveness
+            if name in mentioned else 0.0
         )
         s_boost = self._silence_boost(name)
         return (
@@ -182,12 +202,14 @@ class Bartender:
             + s_boost
         )
 
-    def _time_factor(self, name: str) -> float:
+    def _time_factor(
+        self, name: str, now: float
+    ) -> float:
         """How long since this agent last spoke."""
         last = self.last_spoke.get(name, 0.0)
         if last == 0.0:
             return 1.0
-        elapsed = time.time() - last
+        elapsed = now - last
         return min(elapsed / TIME_CAP, 1.0)
 
     def _silence_boost(self, name: str) -> float:
@@ -197,18 +219,3 @@ class Bartender:
         if gap >= SILENCE_THRESHOLD:
             return SILENCE_BOOST
         return 0.0
-
-    def _addressed_factor(
-        self,
-        name: str,
-        agent: AgentConfig,
-        last_message: Message | None,
-    ) -> float:
-        """Was this agent mentioned in the last msg?"""
-        if last_message is None:
-            return 0.0
-        if last_message.agent_name == name:
-            return 0.0
-        if name.lower() in last_message.content.lower():
-            return agent.responsiveness
-        return 0.0
@@ -2,6 +2,8 @@
 """Configuration loading and validation for Dive Bar."""
 
 import os
+import sys
+from dataclasses import fields
 from pathlib import Path
 
 import tomllib
@@ -30,98 +32,31 @@ def _find_project_root() -> Path:
     return current
 
 
-def _load_bar_config(data: dict) -> BarConfig:
-    """Parse [bar] section from config."""
-    bar = data.get("bar", {})
-    return BarConfig(
-        name=bar.get("name", "The Rusty Nail"),
-        max_agents=bar.get("max_agents", 5),
-        tick_interval=bar.get("tick_interval", 2.0),
-        max_subject_chat=bar.get(
-            "max_subject_chat", 3
-        ),
-    )
-
+def _from_table(cls, table: dict):
+    """Build a config dataclass from a TOML table.
 
-def _load_api_config(data: dict) -> APIConfig:
-    """Parse [llm.api] section from config."""
-    api = data.get("llm", {}).get("api", {})
-    return APIConfig(
-        provider=api.get("provider", "anthropic"),
-        api_key=api.get("api_key", ""),
-        model=api.get("model", "claude-opus-4-6"),
-        base_url=api.get("base_url", ""),
-    )
+    Missing keys fall back to the dataclass defaults;
+    unknown keys are ignored.
+    """
+    return cls(**{
+        f.name: table[f.name]
+        for f in fields(cls)
+        if f.name in table
+    })
 
 
 def _load_llm_config(data: dict) -> LLMConfig:
-    """Parse [llm] section from config."""
+    """Parse [llm] and its sub-tables from config."""
     llm = data.get("llm", {})
-    gen_data = llm.get("generation", {})
-    generation = LLMGeneration(
-        temperature=gen_data.get("temperature", 0.85),
-        top_p=gen_data.get("top_p", 0.9),
-        top_k=gen_data.get("top_k", 50),
-        min_p=gen_data.get("min_p", 0.05),
-        max_tokens=gen_data.get("max_tokens", 200),
-        repeat_penalty=gen_data.get(
-            "repeat_penalty", 1.1
-        ),
-        frequency_penalty=gen_data.get(
-            "frequency_penalty", 0.0
-        ),
-        presence_penalty=gen_data.get(
-            "presence_penalty", 0.0
+    return _from_table(LLMConfig, {
+        **llm,
+        "generation": _from_table(
+            LLMGeneration, llm.get("generation", {})
         ),
-    )
-    return LLMConfig(
-        mode=llm.get("mode", "local"),
-        model_path=llm.get("model_path", ""),
-        n_ctx=llm.get("n_ctx", 4096),
-        n_gpu_layers=llm.get("n_gpu_layers", -1),
-        chat_format=llm.get(
-            "chat_format", "mistral-instruct"
+        "api": _from_table(
+            APIConfig, llm.get("api", {})
         ),
-        seed=llm.get("seed", 42),
-        generation=generation,
-        api=_load_api_config(data),
-    )
-
-
-def _load_display_config(data: dict) -> DisplayConfig:
-    """Parse [display] section from config."""
-    disp = data.get("display", {})
-    return DisplayConfig(
-        response_speed=disp.get("response_speed", 30),
-        show_timestamps=disp.get(
-            "show_timestamps", True
-        ),
-        color_scheme=disp.get(
-            "color_scheme", "default"
-        ),
-    )
-
-
-def _load_database_config(data: dict) -> DatabaseConfig:
-    """Parse [database] section from config."""
-    db = data.get("database", {})
-    return DatabaseConfig(
-        path=db.get("path", "data/dive_bar.duckdb"),
-    )
-
-
-def _load_diversity_config(data: dict) -> DiversityConfig:
-    """Parse [diversity] section from config."""
-    div = data.get("diversity", {})
-    return DiversityConfig(
-        enabled=div.get("enabled", True),
-        threshold=div.get("threshold", 0.6),
-        max_retries=div.get("max_retries", 3),
-        window_size=div.get("window_size", 10),
-        ngram_min=div.get("ngram_min", 3),
-        ngram_max=div.get("ngram_max", 6),
-        refresh_interval=div.get("refresh_interval", 20),
-    )
+    })
 
 
 def _load_agents(data: dict) -> list[AgentConfig]:
@@ -129,7 +64,7 @@ def _load_agents(data: dict) -> list[AgentConfig]:
     agents = []
     for entry in data.get("agent", []):
         agents.append(AgentConfig(
-            name=entry["name"],
+            name=sys.intern(entry["name"]),
             backstory=entry.get("backstory", "").strip(),
             personality_traits=entry.get(
                 "personality_traits", []
@@ -164,10 +99,20 @@ def load_config(
         agents_data = tomllib.load(f)
 
     return AppConfig(
-        bar=_load_bar_config(config_data),
+        bar=_from_table(
+            BarConfig, config_data.get("bar", {})
+        ),
         llm=_load_llm_config(config_data),
-        display=_load_display_config(config_data),
-        database=_load_database_config(config_data),
+        display=_from_table(
+            DisplayConfig, config_data.get("display", {})
+        ),
+        database=_from_table(
+            DatabaseConfig,
+            config_data.get("database", {}),
+        ),
         agents=_load_agents(agents_data),
-        diversity=_load_diversity_config(config_data),
+        diversity=_from_table(
+            DiversityConfig,
+            config_data.get("diversity", {}),
+        ),
     )
@@ -4,10 +4,15 @@
 import hashlib
 import threading
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
 import duckdb
 
+# Queued message rows are written once this many
+# accumulate, or every FLUSH_INTERVAL seconds.
+FLUSH_ROWS = 32
+FLUSH_INTERVAL = 2.0
 
 SESSIONS_SQL = """
 CREATE TABLE IF NOT EXISTS sessions (
@@ -65,16 +70,19 @@ CREATE TABLE IF NOT EXISTS regenerations (
 )
 """
 
-INSERT_MESSAGE_SQL = """
+# Followed by one MESSAGE_ROW per queued message, so
+# a whole batch is a single multi-row INSERT.
+INSERT_MESSAGES_SQL = """
 INSERT INTO messages (
     message_id, session_id, turn_number,
     agent_name, content, model_name,
     tokens_prompt, tokens_completion,
     generation_time_ms, temperature, top_p,
     selection_reason, chattiness, score,
-    addressed_by
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    addressed_by, created_at
+) VALUES
 """
+MESSAGE_ROW = "(" + ", ".join(["?"] * 16) + ")"
 
 
 class Database:
@@ -85,7 +93,12 @@ class Database:
         path.parent.mkdir(parents=True, exist_ok=True)
         self.con = duckdb.connect(str(path))
         self._lock = threading.Lock()
+        self._pending: list[list] = []
+        self._closed = threading.Event()
         self._init_schema()
+        threading.Thread(
+            target=self._flush_loop, daemon=True
+        ).start()
 
     def _init_schema(self):
         """Create tables if they don't exist."""
@@ -135,33 +148,62 @@ class Database:
         score: float = 0.0,
         addressed_by: str = "",
     ):
-        """Log a single message to the database."""
-        message_id = str(uuid.uuid4())
+        """Queue a message for the next batched write.
+
+        created_at is stamped now, so batching does
+        not change the recorded message order.
+        """
+        row = [
+            str(uuid.uuid4()),
+            session_id,
+            turn_number,
+            agent_name,
+            content,
+            model_name,
+            tokens_prompt,
+            tokens_completion,
+            generation_time_ms,
+            temperature,
+            top_p,
+            selection_reason,
+            chattiness,
+            score,
+            addressed_by,
+            datetime.now(timezone.utc),
+        ]
         with self._lock:
-            self.con.execute(
-                INSERT_MESSAGE_SQL,
-                [
-                    message_id,
-                    session_id,
-                    turn_number,
-                    agent_name,
-                    content,
-                    model_name,
-                    tokens_prompt,
-                    tokens_completion,
-                    generation_time_ms,
-                    temperature,
-                    top_p,
-                    selection_reason,
-                    chattiness,
-                    score,
-                    addressed_by,
-                ],
-            )
+            self._pending.append(row)
+            if len(self._pending) >= FLUSH_ROWS:
+                self._flush_pending()
+
+    def _flush_pending(self):
+        """Write queued messages (caller holds lock)."""
+        if not self._pending:
+            return
+        values = ", ".join(
+            [MESSAGE_ROW] * len(self._pending)
+        )
+        self.con.execute(
+            INSERT_MESSAGES_SQL + values,
+            [v for row in self._pending for v in row],
+        )
+        self._pending = []
+
+    def flush(self):
+        """Write any queued messages now."""
+        with self._lock:
+            self._flush_pending()
+
+    def _flush_loop(self):
+        """Flush queued messages until closed."""
+        while not self._closed.wait(FLUSH_INTERVAL):
+            self.flush()
 
     def end_session(self, session_id: str):
-        """Mark a session as ended."""
+        """Flush queued messages and mark a session
+        as ended."""
         with self._lock:
+            self._flush_pending()
             self.con.execute(
                 "UPDATE sessions "
                 "SET ended_at = current_timestamp "
@@ -198,6 +240,7 @@ class Database:
     ) -> list[dict]:
         """Retrieve all messages for a session."""
         with self._lock:
+            self._flush_pending()
             result = self.con.execute(
                 "SELECT turn_number, agent_name, "
                 "content, created_at "
@@ -223,6 +266,8 @@ class Database:
         ).hexdigest()[:16]
 
     def close(self):
-        """Close the database connection."""
+        """Flush queued messages and close."""
+        self._closed.set()
         with self._lock:
+            self._flush_pending()
             self.con.close()
@@ -4,7 +4,9 @@
 import re
 import string
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from dive_bar.models import Message
 
@@ -31,6 +33,15 @@ W_STRUCT = 0.25
 NGRAM_OVERLAP_THRESHOLD = 0.30
 MAX_OPENER_REPEATS = 2
 
+# Per-text results kept across turns; history
+# messages are rescored every turn until they leave
+# the window.
+TEXT_CACHE_SIZE = 256
+
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+
 
 @dataclass
 class DiversityResult:
@@ -44,28 +55,21 @@ class DiversityResult:
     structural_score: float = 1.0
 
 
+@dataclass
+class HistoryProfile:
+    """History-side inputs to diversity scoring."""
+
+    ngrams: set[tuple[str, ...]]
+    opener_counts: Counter
+    agent_features: list[dict]
+
+
 def tokenize(text: str) -> list[str]:
     """Lowercase, strip punctuation, remove stops."""
-    text = text.lower()
-    text = text.translate(
-        str.maketrans("", "", string.punctuation)
-    )
-    words = text.split()
+    words = text.lower().translate(_PUNCT_TABLE).split()
     return [w for w in words if w not in STOP_WORDS]
 
 
-def extract_ngrams(
-    words: list[str], n: int
-) -> list[tuple[str, ...]]:
-    """Return contiguous n-grams from word list."""
-    if len(words) < n:
-        return []
-    return [
-        tuple(words[i:i + n])
-        for i in range(len(words) - n + 1)
-    ]
-
-
 def _build_history_ngrams(
     history: list[Message],
     ngram_min: int = 3,
@@ -74,12 +78,32 @@ def _build_history_ngrams(
     """Extract all n-grams from history messages."""
     ngrams: set[tuple[str, ...]] = set()
     for msg in history:
-        words = tokenize(msg.content)
-        for n in range(ngram_min, ngram_max + 1):
-            ngrams.update(extract_ngrams(words, n))
+        ngrams.update(_text_ngrams(
+            msg.content, ngram_min, ngram_max
+        ))
     return ngrams
 
 
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _text_ngrams(
+    text: str, ngram_min: int, ngram_max: int
+) -> frozenset[tuple[str, ...]]:
+    """All n-grams of one message, cached by text.
+
+    One sweep over start positions emits every size
+    that fits there.
+    """
+    words = tokenize(text)
+    count = len(words)
+    return frozenset(
+        tuple(words[i:i + n])
+        for i in range(count - ngram_min + 1)
+        for n in range(
+            ngram_min, min(ngram_max, count - i) + 1
+        )
+    )
+
+
 def _check_ngram_overlap(
     response: str,
     history_ngrams: set[tuple[str, ...]],
@@ -91,27 +115,29 @@ def _check_ngram_overlap(
     Returns (overlap_ratio, list of repeated phrases).
     """
     words = tokenize(response)
-    if len(words) < ngram_min:
+    count = len(words)
+    if count < ngram_min:
         return 0.0, []
-    response_ngrams: list[tuple[str, ...]] = []
+    total = hits = 0
+    phrases: set[str] = set()
     for n in range(ngram_min, ngram_max + 1):
-        response_ngrams.extend(extract_ngrams(words, n))
-    if not response_ngrams:
+        for i in range(count - n + 1):
+            total += 1
+            gram = tuple(words[i:i + n])
+            if gram in history_ngrams:
+                hits += 1
+                phrases.add(" ".join(gram))
+    if not total:
         return 0.0, []
-    overlapping = [
-        ng for ng in response_ngrams
-        if ng in history_ngrams
-    ]
-    ratio = len(overlapping) / len(response_ngrams)
-    phrases = list({" ".join(ng) for ng in overlapping})
-    return ratio, phrases[:5]
+    return hits / total, list(phrases)[:5]
 
 
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
 def _get_opener(text: str) -> str:
     """Extract first 6 words as opener signature."""
-    words = text.lower().split()[:6]
+    words = text.lower().split(None, 6)[:6]
     opener = " ".join(words)
-    return re.sub(r"[^\w\s]", "", opener).strip()
+    return _NON_WORD_RE.sub("", opener).strip()
 
 
 def _build_opener_counts(
@@ -144,12 +170,18 @@ def _check_formulaic_opener(
     return None
 
 
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
 def _compute_structural_features(text: str) -> dict:
-    """Extract structural features from text."""
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    """Extract structural features from text.
+
+    Cached: callers must not mutate the result.
+    """
+    sentences = sum(
+        1 for s in _SENTENCE_END_RE.split(text)
+        if s and not s.isspace()
+    )
     return {
-        "sentence_count": len(sentences),
+        "sentence_count": sentences,
         "question_marks": text.count("?"),
         "commas": text.count(","),
         "exclamations": text.count("!"),
@@ -159,27 +191,19 @@ def _compute_structural_features(text: str) -> dict:
 
 def _check_structural_similarity(
     response: str,
-    history: list[Message],
-    agent_name: str,
+    agent_features: list[dict],
 ) -> float:
     """Compare structure against last 3 agent responses.
 
     Returns similarity score 0-1 (1 = very similar = bad).
     """
-    agent_msgs = [
-        m for m in history
-        if m.agent_name == agent_name
-    ][-3:]
-    if not agent_msgs:
+    if not agent_features:
         return 0.0
     resp_features = _compute_structural_features(response)
-    similarities = []
-    for msg in agent_msgs:
-        msg_features = _compute_structural_features(
-            msg.content
-        )
-        sim = _feature_similarity(resp_features, msg_features)
-        similarities.append(sim)
+    similarities = [
+        _feature_similarity(resp_features, f)
+        for f in agent_features
+    ]
     return sum(similarities) / len(similarities)
 
 
@@ -193,56 +217,98 @@ def _feature_similarity(f1: dict, f2: dict) -> float:
     return matches / total if total > 0 else 0.0
 
 
+def build_history_profile(
+    history: Sequence[Message],
+    agent_name: str,
+    window: int = 10,
+    ngram_min: int = 3,
+    ngram_max: int = 6,
+) -> HistoryProfile:
+    """Precompute what scoring needs from history.
+
+    Build once per turn and pass to every
+    compute_diversity_score call for that turn.
+    """
+    recent = list(history)[-window:]
+    agent_msgs = [
+        m for m in recent
+        if m.agent_name == agent_name
+    ][-3:]
+    return HistoryProfile(
+        ngrams=_build_history_ngrams(
+            recent, ngram_min, ngram_max
+        ),
+        opener_counts=_build_opener_counts(
+            recent, agent_name
+        ),
+        agent_features=[
+            _compute_structural_features(m.content)
+            for m in agent_msgs
+        ],
+    )
+
+
 def compute_diversity_score(
     response: str,
-    history: list[Message],
+    history: Sequence[Message],
     agent_name: str,
     window: int = 10,
     threshold: float = 0.6,
     ngram_min: int = 3,
     ngram_max: int = 6,
+    profile: HistoryProfile | None = None,
 ) -> DiversityResult:
     """Check response against recent history.
 
     Returns DiversityResult with score (0-1) and problems.
     Score of 1.0 means fully diverse, 0.0 means fully
-    repetitive.
+    repetitive. Pass a prebuilt profile to skip
+    rescanning history.
     """
-    recent = history[-window:] if history else []
-    problems: list[str] = []
-    repeated_ngrams: list[str] = []
-    formulaic_opener: str | None = None
-    # 1. N-gram overlap detection
-    history_ngrams = _build_history_ngrams(
-        recent, ngram_min, ngram_max
+    if profile is None:
+        profile = build_history_profile(
+            history, agent_name, window,
+            ngram_min, ngram_max,
+        )
+    if not (
+        profile.ngrams
+        or profile.opener_counts
+        or profile.agent_features
+    ):
+        # Nothing to repeat: every check scores clean
+        return DiversityResult(
+            score=1.0, passed=1.0 >= threshold
+        )
+    return _score_against(
+        response, profile, threshold,
+        ngram_min, ngram_max,
     )
+
+
+def _score_against(
+    response: str,
+    profile: HistoryProfile,
+    threshold: float,
+    ngram_min: int,
+    ngram_max: int,
+) -> DiversityResult:
+    """Run the three checks and weight them."""
     overlap_ratio, phrases = _check_ngram_overlap(
-        response, history_ngrams, ngram_min, ngram_max
+        response, profile.ngrams, ngram_min, ngram_max
+    )
+    repeated_ngrams = (
+        phrases if overlap_ratio > NGRAM_OVERLAP_THRESHOLD
+        else []
     )
-    if overlap_ratio > NGRAM_OVERLAP_THRESHOLD:
-        problems.append(
-            f"Repeated phrases: {', '.join(phrases[:3])}"
-        )
-        repeated_ngrams = phrases
-    ngram_score = 1.0 - min(1.0, overlap_ratio / 0.5)
-    # 2. Formulaic opener detection
-    opener_counts = _build_opener_counts(recent, agent_name)
     formulaic_opener = _check_formulaic_opener(
-        response, opener_counts
+        response, profile.opener_counts
     )
-    if formulaic_opener:
-        problems.append(
-            f"Repeated opener: \"{formulaic_opener[:40]}\""
-        )
-    opener_score = 0.0 if formulaic_opener else 1.0
-    # 3. Structural similarity detection
     struct_sim = _check_structural_similarity(
-        response, recent, agent_name
+        response, profile.agent_features
     )
-    if struct_sim > 0.7:
-        problems.append("Similar structure to recent msgs")
+    ngram_score = 1.0 - min(1.0, overlap_ratio / 0.5)
+    opener_score = 0.0 if formulaic_opener else 1.0
     struct_score = 1.0 - struct_sim
-    # 4. Aggregate weighted score
     final_score = (
         W_NGRAM * ngram_score +
         W_OPENER * opener_score +
@@ -251,8 +317,31 @@ def compute_diversity_score(
     return DiversityResult(
         score=round(final_score, 3),
         passed=final_score >= threshold,
-        problems=problems,
+        problems=_collect_problems(
+            repeated_ngrams, formulaic_opener, struct_sim
+        ),
         repeated_ngrams=repeated_ngrams,
         formulaic_opener=formulaic_opener,
         structural_score=struct_score,
     )
+
+
+def _collect_problems(
+    repeated_ngrams: list[str],
+    formulaic_opener: str | None,
+    struct_sim: float,
+) -> list[str]:
+    """Describe each check that failed."""
+    problems: list[str] = []
+    if repeated_ngrams:
+        problems.append(
+            "Repeated phrases: "
+            f"{', '.join(repeated_ngrams[:3])}"
+        )
+    if formulaic_opener:
+        problems.append(
+            f"Repeated opener: \"{formulaic_opener[:40]}\""
+        )
+    if struct_sim > 0.7:
+        problems.append("Similar structure to recent msgs")
+    return problems
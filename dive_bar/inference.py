@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """LLM inference engine for Dive Bar."""
 
+import os
 import threading
 import time
 
-from llama_cpp import Llama
+from llama_cpp import Llama, LlamaRAMCache
 
 from dive_bar.models import GenerationResult, LLMConfig
 
@@ -28,18 +29,56 @@ class InferenceEngine:
         self._lock = threading.Lock()
         self.llm = None
         self._logit_bias: dict[int, float] = {}
+        self._base_kwargs: dict = {}
+        self._affinity: set[int] = set()
 
     def load_model(self):
         """Load the model into memory."""
+        self._affinity = self._check_affinity()
+        threads = len(self._affinity) or None
         self.llm = Llama(
             model_path=self.config.model_path,
             n_ctx=self.config.n_ctx,
             n_gpu_layers=self.config.n_gpu_layers,
+            n_batch=self.config.n_batch,
+            offload_kqv=self.config.offload_kqv,
+            flash_attn=self.config.flash_attn,
+            n_threads=threads,
+            n_threads_batch=threads,
             chat_format=self.config.chat_format,
             seed=self.config.seed,
             verbose=False,
         )
+        if self.config.prompt_cache_mb > 0:
+            # Opt-in: saves context state after each
+            # completion; opener and topic calls share
+            # the same LRU as agent turns.
+            self.llm.set_cache(LlamaRAMCache(
+                capacity_bytes=(
+                    self.config.prompt_cache_mb << 20
+                ),
+            ))
         self._build_logit_bias()
+        self._base_kwargs = self._build_base_kwargs()
+
+    def _check_affinity(self) -> set[int]:
+        """Validate llm.cpu_affinity once at load.
+
+        Empty, or a platform without affinity
+        support, means no pinning.
+        """
+        wanted = set(self.config.cpu_affinity)
+        if not wanted or not hasattr(
+            os, "sched_setaffinity"
+        ):
+            return set()
+        bad = wanted - os.sched_getaffinity(0)
+        if bad:
+            raise RuntimeError(
+                "llm.cpu_affinity lists cores this "
+                f"process cannot use: {sorted(bad)}"
+            )
+        return wanted
 
     def _build_logit_bias(self):
         """Build logit bias from suppressed words.
@@ -78,6 +117,27 @@ class InferenceEngine:
             common.update(tokens)
         return common
 
+    def _build_base_kwargs(self) -> dict:
+        """Completion kwargs fixed for the session.
+
+        Built once at load; each call only layers its
+        messages, stops and overrides on top.
+        """
+        gen = self.gen_params
+        kwargs = {
+            "temperature": gen.temperature,
+            "top_p": gen.top_p,
+            "top_k": gen.top_k,
+            "min_p": gen.min_p,
+            "max_tokens": gen.max_tokens,
+            "repeat_penalty": gen.repeat_penalty,
+            "frequency_penalty": gen.frequency_penalty,
+            "presence_penalty": gen.presence_penalty,
+        }
+        if self._logit_bias:
+            kwargs["logit_bias"] = self._logit_bias
+        return kwargs
+
     def generate(
         self,
         messages: list[dict],
@@ -91,68 +151,36 @@ class InferenceEngine:
         """
         if self.llm is None:
             raise RuntimeError("Model not loaded")
-        params = self._merge_params(overrides)
         with self._lock:
             return self._do_generate(
-                messages, params, stop
+                messages, stop, overrides
             )
 
-    def _merge_params(
-        self, overrides: dict
-    ) -> dict:
-        """Merge generation defaults with overrides."""
-        return {
-            "temperature": self.gen_params.temperature,
-            "top_p": self.gen_params.top_p,
-            "top_k": self.gen_params.top_k,
-            "min_p": self.gen_params.min_p,
-            "max_tokens": self.gen_params.max_tokens,
-            "repeat_penalty": (
-                self.gen_params.repeat_penalty
-            ),
-            "frequency_penalty": (
-                self.gen_params.frequency_penalty
-            ),
-            "presence_penalty": (
-                self.gen_params.presence_penalty
-            ),
-            **overrides,
-        }
-
     def _do_generate(
         self,
         messages: list[dict],
-        params: dict,
-        stop: list[str] | None = None,
+        stop: list[str] | None,
+        overrides: dict,
     ) -> GenerationResult:
         """Run inference (must hold lock)."""
-        t0 = time.perf_counter()
+        if self._affinity:
+            # Pin whichever worker thread got this
+            # turn; llama.cpp's compute threads are
+            # spawned from it and inherit the mask.
+            os.sched_setaffinity(0, self._affinity)
+        t0 = time.perf_counter_ns()
         kwargs = {
+            **self._base_kwargs,
+            **overrides,
             "messages": messages,
-            "temperature": params["temperature"],
-            "top_p": params["top_p"],
-            "top_k": params["top_k"],
-            "min_p": params["min_p"],
-            "max_tokens": params["max_tokens"],
-            "repeat_penalty": (
-                params["repeat_penalty"]
-            ),
-            "frequency_penalty": (
-                params["frequency_penalty"]
-            ),
-            "presence_penalty": (
-                params["presence_penalty"]
-            ),
         }
         if stop:
             kwargs["stop"] = stop
-        if self._logit_bias:
-            kwargs["logit_bias"] = self._logit_bias
         result = self.llm.create_chat_completion(
             **kwargs
         )
         elapsed_ms = (
-            (time.perf_counter() - t0) * 1000
+            (time.perf_counter_ns() - t0) / 1_000_000
         )
         content = (
             result["choices"][0]["message"]["content"]
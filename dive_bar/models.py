@@ -4,7 +4,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for a single bar agent."""
 
@@ -18,7 +18,7 @@ class AgentConfig:
     model_override: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     """A single message in the bar conversation."""
 
@@ -28,7 +28,7 @@ class Message:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationResult:
     """Result from LLM inference."""
 
@@ -38,17 +38,17 @@ class GenerationResult:
     generation_time_ms: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BarConfig:
     """Global bar configuration."""
 
-    name: str
-    max_agents: int
-    tick_interval: float
+    name: str = "The Rusty Nail"
+    max_agents: int = 5
+    tick_interval: float = 2.0
     max_subject_chat: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMGeneration:
     """LLM generation parameters."""
 
@@ -62,7 +62,7 @@ class LLMGeneration:
     presence_penalty: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API provider configuration."""
 
@@ -72,7 +72,7 @@ class APIConfig:
     base_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM configuration."""
 
@@ -80,8 +80,15 @@ class LLMConfig:
     model_path: str = ""
     n_ctx: int = 4096
     n_gpu_layers: int = -1
+    n_batch: int = 512
+    offload_kqv: bool = True
+    flash_attn: bool = False
     chat_format: str = "mistral-instruct"
     seed: int = 42
+    prompt_cache_mb: int = 0
+    cpu_affinity: list[int] = field(
+        default_factory=list
+    )
     generation: LLMGeneration = field(
         default_factory=LLMGeneration
     )
@@ -90,7 +97,7 @@ class LLMConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Display settings."""
 
@@ -99,14 +106,14 @@ class DisplayConfig:
     color_scheme: str = "default"
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database settings."""
 
     path: str = "data/dive_bar.duckdb"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiversityConfig:
     """Diversity checking configuration."""
 
@@ -119,7 +126,7 @@ class DiversityConfig:
     refresh_interval: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
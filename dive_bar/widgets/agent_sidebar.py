@@ -1,22 +1,31 @@
 #!/usr/bin/env python3
 """Agent sidebar widget for Dive Bar TUI."""
 
+from rich.text import Text
 from textual.app import ComposeResult
-from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Label, Static
 
 
-class AgentStatus(Static):
-    """Status display for a single agent."""
+# (status, icon markup) for each agent state
+STATUS_ICONS = (
+    ("idle", "[dim]o[/]"),
+    ("thinking", "[yellow]*[/]"),
+    ("talking", "[green]>[/]"),
+)
 
-    status = reactive("idle")
 
-    STATUS_ICONS = {
-        "idle": "[dim]o[/]",
-        "thinking": "[yellow]*[/]",
-        "talking": "[green]>[/]",
-    }
+def _status_line(
+    icon: str, agent_name: str, drink: str
+) -> Text:
+    """Parse one agent status line's markup."""
+    return Text.from_markup(
+        f" {icon} {agent_name}  [dim]{drink}[/]"
+    )
+
+
+class AgentStatus(Static):
+    """Status display for a single agent."""
 
     def __init__(
         self,
@@ -24,23 +33,29 @@ class AgentStatus(Static):
         drink: str,
         **kwargs,
     ):
-        super().__init__(**kwargs)
+        rendered = {
+            status: _status_line(icon, agent_name, drink)
+            for status, icon in STATUS_ICONS
+        }
+        super().__init__(rendered["idle"], **kwargs)
         self.agent_name = agent_name
         self.drink = drink
-
-    def render(self) -> str:
-        """Render the agent status line."""
-        icon = self.STATUS_ICONS.get(
-            self.status, "?"
-        )
-        return (
-            f" {icon} {self.agent_name}"
-            f"  [dim]{self.drink}[/]"
+        self.status = "idle"
+        self._rendered = rendered
+        self._fallback = _status_line(
+            "?", agent_name, drink
         )
 
     def set_status(self, status: str):
         """Update the agent's status."""
+        if status == self.status:
+            return
         self.status = status
+        # Every line is the same width: no relayout
+        self.update(
+            self._rendered.get(status, self._fallback),
+            layout=False,
+        )
 
 
 class AgentSidebar(Widget):
@@ -17,6 +17,11 @@ AGENT_COLORS = [
 ]
 
 
+def _name_style(index: int) -> str:
+    """Name style for the index-th speaker."""
+    return f"bold {AGENT_COLORS[index % len(AGENT_COLORS)]}"
+
+
 class ChatPanel(RichLog):
     """Scrolling chat display for bar conversation."""
 
@@ -29,23 +34,37 @@ class ChatPanel(RichLog):
 
     def __init__(self, **kwargs):
         super().__init__(
-            highlight=True,
-            markup=True,
+            highlight=False,
+            markup=False,
             wrap=True,
             **kwargs,
         )
-        self._color_map: dict[str, str] = {}
-        self._color_index = 0
+        self._style_map: dict[str, str] = {}
+        # RichLog renders a Text to strips on write
+        # (or copies it if sized later), so one
+        # scratch line can be reused for every write.
+        self._line = Text()
+
+    def register_agents(self, names: list[str]):
+        """Assign each speaker a color up front."""
+        self._style_map = {
+            name: _name_style(i)
+            for i, name in enumerate(names)
+        }
+
+    def _get_style(self, agent_name: str) -> str:
+        """Name style for a speaker, assigned once."""
+        style = self._style_map.get(agent_name)
+        if style is None:
+            style = _name_style(len(self._style_map))
+            self._style_map[agent_name] = style
+        return style
 
-    def _get_color(self, agent_name: str) -> str:
-        """Get or assign a color for an agent."""
-        if agent_name not in self._color_map:
-            color = AGENT_COLORS[
-                self._color_index % len(AGENT_COLORS)
-            ]
-            self._color_map[agent_name] = color
-            self._color_index += 1
-        return self._color_map[agent_name]
+    def _fresh_line(self) -> Text:
+        """Clear and return the scratch line."""
+        line = self._line
+        line.plain = ""
+        return line
 
     def add_message(
         self,
@@ -54,8 +73,7 @@ class ChatPanel(RichLog):
         timestamp: str = "",
     ):
         """Add a colored message to the chat log."""
-        color = self._get_color(agent_name)
-        line = Text()
+        line = self._fresh_line()
         if timestamp:
             line.append(
                 f"[{timestamp}] ",
@@ -63,13 +81,13 @@ class ChatPanel(RichLog):
             )
         line.append(
             f"{agent_name}: ",
-            style=f"bold {color}",
+            style=self._get_style(agent_name),
         )
         line.append(content)
         self.write(line)
 
     def add_system_message(self, content: str):
         """Add a system/narrator message."""
-        line = Text()
+        line = self._fresh_line()
         line.append(f"* {content} *", style="dim italic")
         self.write(line)
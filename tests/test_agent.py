@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Tests for agent prompt building."""
+
+import unittest
+
+from dive_bar.agent import Agent
+from dive_bar.models import AgentConfig, Message
+
+
+def _agent(name: str) -> Agent:
+    """Build an agent with a minimal config."""
+    config = AgentConfig(
+        name=name,
+        backstory="Regular.",
+        personality_traits=["gruff"],
+        chattiness=0.5,
+        responsiveness=0.5,
+        drink="Beer",
+        speaking_style="Short.",
+    )
+    return Agent(config, bar_name="The Rusty Nail")
+
+
+class TestReplySuffix(unittest.TestCase):
+    """Names with braces must not break prompt text."""
+
+    def test_braced_names(self):
+        for name in ("Big {Al}", "Brace}", "{"):
+            agent = _agent(name)
+            history = [Message("{Rosa}", "Hi.", 1, 0.0)]
+            content = agent.build_messages(history)[1][
+                "content"
+            ]
+            self.assertIn(f"Now reply as {name},", content)
+            self.assertIn(
+                "React directly to {Rosa} --", content
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()